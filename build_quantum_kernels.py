@@ -0,0 +1,35 @@
+"""
+Brion Quantum - Kernel AOT Build
+Compiles the annealing kernel ahead of time into the quantum_kernels
+extension module, so deployments skip numba JIT compilation at startup.
+
+Usage:
+    python build_quantum_kernels.py
+
+QuantumAICore picks up quantum_kernels automatically when it is importable;
+the compiled module does not need numba at runtime.
+"""
+
+import os
+
+import numpy as np
+from numba.pycc import CC
+
+from quantum_ai_core import _anneal_loop
+
+cc = CC('quantum_kernels')
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+
+
+@cc.export('seed', 'void(u4)')
+def seed(value):
+    np.random.seed(value)
+
+
+# The trailing `none` is the kernel's rng argument: the AOT build always
+# draws from its own internal stream, reseeded through seed().
+cc.export('anneal', 'UniTuple(f8, 2)(i8, f8, b1, none)')(_anneal_loop)
+
+
+if __name__ == '__main__':
+    cc.compile()
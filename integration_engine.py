@@ -4,12 +4,213 @@ Orchestrates cross-system integration for the System Integration Program.
 Connects quantum AI core, self-healing, and external services.
 """
 
+import asyncio
+import queue
 import time
 import logging
-from typing import Dict, Any, List, Optional
+from collections import deque
+from collections.abc import Mapping, MutableMapping
+from typing import Deque, Dict, Any, Iterator, List, Optional, Tuple
+
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
+STATUS_ACTIVE = 0
+
+
+class ServiceRow(MutableMapping):
+    """
+    Live view of one ServiceTable row in the per-service dict layout.
+    Reads and writes go straight to the table's columns, so
+    `row['status'] = 'inactive'` is seen by every status scan.
+    Use to_dict() for a plain, JSON-serializable snapshot. Once the service
+    is removed from the table, every access raises LookupError.
+    """
+
+    __slots__ = ('_table', '_name')
+
+    FIELDS = ('type', 'endpoint', 'config', 'status', 'registered_at', 'message_count')
+
+    def __init__(self, table: 'ServiceTable', name: str):
+        self._table = table
+        self._name = name
+
+    def _row(self) -> int:
+        """Current row index of this service; raises if it was unregistered."""
+        i = self._table.index.get(self._name)
+        if i is None:
+            # Not a KeyError, so Mapping.get() cannot mistake it for a missing field
+            raise LookupError(f"Service '{self._name}' is no longer registered")
+        return i
+
+    def __getitem__(self, key: str) -> Any:
+        table = self._table
+        i = self._row()
+        if key == 'status':
+            return table.status_names[table._status[i]]
+        column = table.columns.get(key)
+        if column is not None:
+            return column[i]
+        return table.extras[i][key]
+
+    def __setitem__(self, key: str, value: Any):
+        table = self._table
+        i = self._row()
+        if key == 'status':
+            table._status[i] = table.status_code(value)
+            return
+        column = table.columns.get(key)
+        if column is not None:
+            column[i] = value
+        else:
+            table.extras[i][key] = value
+
+    def __delitem__(self, key: str):
+        i = self._row()
+        if key in self.FIELDS:
+            raise TypeError(f"Cannot delete core service field '{key}'")
+        del self._table.extras[i][key]
+
+    def __iter__(self) -> Iterator[str]:
+        extras = self._table.extras[self._row()]
+        yield from self.FIELDS
+        yield from extras
+
+    def __len__(self) -> int:
+        return len(self.FIELDS) + len(self._table.extras[self._row()])
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dict copy of the row's current fields."""
+        return dict(self)
+
+    def __repr__(self) -> str:
+        return repr(self.to_dict())
+
+
+class ServiceTable(MutableMapping):
+    """
+    Struct-of-arrays registry of integrated services.
+
+    Each field is kept in its own column. Status codes live in a NumPy array
+    (grown by doubling) so health scans are single vectorized compares;
+    per-message counters stay a Python list, which is cheaper to bump one
+    element at a time. Looking a service up by name returns a live
+    ServiceRow, and assigning a dict to a name registers or replaces it.
+    """
+
+    def __init__(self):
+        self.index: Dict[str, int] = {}
+        self.names: List[str] = []
+        self._names_tuple: Optional[Tuple[str, ...]] = ()
+        self.types: List[str] = []
+        self.endpoints: List[str] = []
+        self.configs: List[Dict] = []
+        self.registered_at: List[float] = []
+        self.message_counts: List[int] = []
+        self.extras: List[Dict[str, Any]] = []
+        self.columns: Dict[str, List] = {
+            'type': self.types,
+            'endpoint': self.endpoints,
+            'config': self.configs,
+            'registered_at': self.registered_at,
+            'message_count': self.message_counts,
+        }
+        self._status = np.zeros(8, dtype=np.uint16)
+        self.status_names: List[str] = ['active']
+        self._status_codes: Dict[str, int] = {'active': STATUS_ACTIVE}
+
+    @property
+    def names_tuple(self) -> Tuple[str, ...]:
+        """Immutable snapshot of service names, rebuilt only after the registry changes."""
+        if self._names_tuple is None:
+            self._names_tuple = tuple(self.names)
+        return self._names_tuple
+
+    @property
+    def status(self) -> np.ndarray:
+        """Status codes of the registered services (a writable view)."""
+        return self._status[:len(self.names)]
+
+    def add(self, name: str, service_type: str, endpoint: str, config: Dict, registered_at: float):
+        """Insert a service, or reset it in place if already registered."""
+        i = self.index.get(name)
+        if i is None:
+            i = len(self.names)
+            if i == self._status.size:
+                grown = np.zeros(2 * i, dtype=self._status.dtype)
+                grown[:i] = self._status
+                self._status = grown
+            self.index[name] = i
+            self.names.append(name)
+            self._names_tuple = None
+            self.types.append(service_type)
+            self.endpoints.append(endpoint)
+            self.configs.append(config)
+            self.registered_at.append(registered_at)
+            self.message_counts.append(0)
+            self.extras.append({})
+        else:
+            self.types[i] = service_type
+            self.endpoints[i] = endpoint
+            self.configs[i] = config
+            self.registered_at[i] = registered_at
+            self.message_counts[i] = 0
+            self.extras[i] = {}
+        self._status[i] = STATUS_ACTIVE
+
+    def status_code(self, status: str) -> int:
+        """Return the integer code for a status string, assigning one if new."""
+        code = self._status_codes.get(status)
+        if code is None:
+            code = len(self.status_names)
+            if code > np.iinfo(self._status.dtype).max:
+                raise ValueError(f"Too many distinct service statuses (limit {code})")
+            self.status_names.append(status)
+            self._status_codes[status] = code
+        return code
+
+    def set_status(self, name: str, status: str):
+        """Set the status of a registered service."""
+        self._status[self.index[name]] = self.status_code(status)
+
+    def __getitem__(self, name: str) -> ServiceRow:
+        if name not in self.index:
+            raise KeyError(name)
+        return ServiceRow(self, name)
+
+    def __setitem__(self, name: str, fields: Mapping):
+        fields = dict(fields)
+        self.add(
+            name,
+            fields.pop('type', ''),
+            fields.pop('endpoint', ''),
+            fields.pop('config', {}),
+            fields.pop('registered_at', time.time()),
+        )
+        row = ServiceRow(self, name)
+        for key, value in fields.items():
+            row[key] = value
+
+    def __delitem__(self, name: str):
+        i = self.index.pop(name)
+        n = len(self.names) - 1
+        self._status[i:n] = self._status[i + 1:n + 1]
+        for column in (self.names, self.extras, *self.columns.values()):
+            del column[i]
+        for j in range(i, n):
+            self.index[self.names[j]] = j
+        self._names_tuple = None
+
+    def __contains__(self, name) -> bool:
+        return name in self.index
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.names)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
 
 class IntegrationEngine:
     """
@@ -23,76 +224,266 @@ class IntegrationEngine:
     """
 
     VERSION = "2.0.6"
+    MESSAGE_QUEUE_CAPACITY = 100_000
+    LOG_CAPACITY = 10_000
+    ASYNC_BATCH_MAX = 256
 
     def __init__(self):
-        self.registered_services: Dict[str, Dict[str, Any]] = {}
-        self.message_queue: List[Dict[str, Any]] = []
-        self.processed_messages: List[Dict[str, Any]] = []
-        self.integration_log: List[Dict[str, Any]] = []
-        self._start_time = time.time()
-        logger.info(f"IntegrationEngine v{self.VERSION} initialized")
+        self.registered_services = ServiceTable()
+        self.message_queue: Deque[Dict[str, Any]] = deque(maxlen=self.MESSAGE_QUEUE_CAPACITY)
+        # Messages queued with send_message_async but not yet settled by the
+        # flusher; everything in message_queue is already delivered or errored.
+        self._pending_count = 0
+        self._total_processed = 0
+        self._inbox: queue.SimpleQueue = queue.SimpleQueue()
+        self._async_queue: Optional[asyncio.Queue] = None
+        self._async_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._flusher: Optional[asyncio.Task] = None
+        self.integration_log: Deque[Dict[str, Any]] = deque(maxlen=self.LOG_CAPACITY)
+        self._start_time = time.monotonic()
+        logger.info("IntegrationEngine v%s initialized", self.VERSION)
 
     def register_service(self, name: str, service_type: str, endpoint: str = '', config: Optional[Dict] = None):
         """Register a service for integration."""
-        self.registered_services[name] = {
-            'type': service_type,
-            'endpoint': endpoint,
-            'config': config or {},
-            'status': 'active',
-            'registered_at': time.time(),
-            'message_count': 0,
-        }
-        logger.info(f"Registered service: {name} ({service_type})")
+        self.registered_services.add(name, service_type, endpoint, config or {}, time.time())
+        logger.info("Registered service: %s (%s)", name, service_type)
 
     def send_message(self, source: str, target: str, payload: Dict[str, Any]) -> Dict[str, Any]:
         """
         Send a message between registered services.
         Returns delivery confirmation.
         """
+        return self._send(source, target, payload, time.time())
+
+    def _send(self, source: str, target: str, payload: Dict[str, Any], ts: float) -> Dict[str, Any]:
+        """Build, route and enqueue one message stamped with a caller-sampled time."""
         message = {
             'source': source,
             'target': target,
             'payload': payload,
-            'timestamp': time.time(),
+            'timestamp': ts,
             'status': 'pending',
         }
 
-        if target not in self.registered_services:
+        self._route(message)
+        self.message_queue.append(message)
+        self._total_processed += 1
+        return message
+
+    def _route(self, message: Dict[str, Any]):
+        """Settle a pending message against the service registry."""
+        services = self.registered_services
+        target = message['target']
+        i = services.index.get(target)
+        if i is None:
             message['status'] = 'error'
             message['error'] = f'Service {target} not registered'
-            logger.warning(f"Message to unregistered service: {target}")
+            logger.warning("Message to unregistered service: %s", target)
         else:
             message['status'] = 'delivered'
-            self.registered_services[target]['message_count'] += 1
+            services.message_counts[i] += 1
 
-        self.message_queue.append(message)
-        self.processed_messages.append(message)
-        return message
+    def send_message_nowait(self, source: str, target: str, payload: Dict[str, Any]):
+        """
+        Enqueue a message without delivering it. Safe to call from any number
+        of producer threads: the only shared state touched is a C-level
+        SimpleQueue. A single consumer settles the messages with drain_messages().
+        """
+        self._inbox.put({
+            'source': source,
+            'target': target,
+            'payload': payload,
+            'timestamp': time.time(),
+            'status': 'pending',
+        })
+
+    def drain_messages(self, max_items: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Settle messages queued with send_message_nowait, up to max_items.
+        Must be called from a single consumer thread; returns the settled messages.
+        A message that cannot be routed is settled with status 'error' instead
+        of aborting the drain, so every message taken off the inbox is recorded.
+        """
+        get = self._inbox.get_nowait
+        messages = []
+        append = messages.append
+        while max_items is None or len(messages) < max_items:
+            try:
+                append(get())
+            except queue.Empty:
+                break
+        route = self._route
+        for message in messages:
+            try:
+                route(message)
+            except Exception as exc:
+                message['status'] = 'error'
+                message['error'] = f'Undeliverable message: {exc}'
+                logger.warning("Undeliverable message to %r: %s", message['target'], exc)
+        self.message_queue.extend(messages)
+        self._total_processed += len(messages)
+        return messages
+
+    async def send_message_async(self, source: str, target: str, payload: Dict[str, Any]) -> asyncio.Future:
+        """
+        Queue a message for delivery by the background flusher.
+        Returns a future that resolves to the settled message, so callers
+        can keep producing while earlier batches are delivered.
+        """
+        loop = asyncio.get_running_loop()
+        if self._async_queue is None or self._async_loop is not loop:
+            self._async_queue = asyncio.Queue(maxsize=self.MESSAGE_QUEUE_CAPACITY)
+            self._async_loop = loop
+            self._flusher = loop.create_task(self._flush_loop(self._async_queue))
+        elif self._flusher.done():
+            # The flusher died (e.g. cancelled); restart it so the queue keeps draining
+            self._flusher = loop.create_task(self._flush_loop(self._async_queue))
+
+        message = {
+            'source': source,
+            'target': target,
+            'payload': payload,
+            'timestamp': time.time(),
+            'status': 'pending',
+        }
+        future = loop.create_future()
+        self._pending_count += 1
+        await self._async_queue.put((message, future))
+        return future
+
+    async def flush(self):
+        """Wait until every message queued with send_message_async is settled."""
+        if self._async_queue is not None:
+            await self._async_queue.join()
+
+    async def aclose(self):
+        """Flush outstanding async messages and stop the background flusher."""
+        await self.flush()
+        if self._flusher is not None:
+            self._flusher.cancel()
+            try:
+                await self._flusher
+            except asyncio.CancelledError:
+                pass
+        self._async_queue = self._async_loop = self._flusher = None
+
+    async def _flush_loop(self, aq: asyncio.Queue):
+        """Drain up to ASYNC_BATCH_MAX queued messages per wake-up and settle them together."""
+        while True:
+            batch = [await aq.get()]
+            while len(batch) < self.ASYNC_BATCH_MAX and not aq.empty():
+                batch.append(aq.get_nowait())
+
+            route = self._route
+            messages = []
+            outcomes = []
+            for message, future in batch:
+                try:
+                    route(message)
+                except Exception as exc:
+                    # send_message raises this to its caller; fail only this future
+                    outcomes.append((future, exc))
+                else:
+                    messages.append(message)
+                    outcomes.append((future, message))
+            self._pending_count -= len(batch)
+            self.message_queue.extend(messages)
+            self._total_processed += len(messages)
+
+            for future, outcome in outcomes:
+                if not future.done():
+                    if isinstance(outcome, BaseException):
+                        future.set_exception(outcome)
+                    else:
+                        future.set_result(outcome)
+                aq.task_done()
 
     def broadcast(self, source: str, payload: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Broadcast a message to all registered services."""
-        results = []
-        for name in self.registered_services:
+        send = self._send
+        ts = time.time()
+        return [
+            send(source, name, payload, ts)
+            for name in self.registered_services.names_tuple
+            if name != source
+        ]
+
+    def iter_broadcast(self, source: str, payload: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        """
+        Broadcast lazily, yielding each delivery confirmation as it is sent.
+        Nothing is sent until iteration starts, and callers that only
+        aggregate the results never hold the full list.
+        """
+        send = self._send
+        clock = time.time
+        for name in self.registered_services.names_tuple:
             if name != source:
-                result = self.send_message(source, name, payload)
-                results.append(result)
-        return results
+                # Stamped per item: the consumer may pause between deliveries
+                yield send(source, name, payload, clock())
+
+    def broadcast_batch(self, source: str, payload: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Broadcast a message to all registered services in a single pass.
+        Builds every message up front with one shared timestamp and payload
+        reference, then enqueues them together.
+        """
+        services = self.registered_services
+        targets = [name for name in self.registered_services.names_tuple if name != source]
+        # Copying a prebuilt template reuses its key table instead of hashing
+        # every key again per message; only 'target' differs between copies.
+        template = {
+            'source': source,
+            'target': None,
+            'payload': payload,
+            'timestamp': time.time(),
+            'status': 'delivered',
+        }
+        copy = template.copy
+        messages = []
+        append = messages.append
+        for t in targets:
+            message = copy()
+            message['target'] = t
+            append(message)
+        self.message_queue.extend(messages)
+        counts = services.message_counts
+        index = services.index
+        for t in targets:
+            counts[index[t]] += 1
+        self._total_processed += len(messages)
+        return messages
 
-    def get_service_status(self, name: str) -> Optional[Dict[str, Any]]:
-        """Get status of a registered service."""
+    def get_service_status(self, name: str) -> Optional[ServiceRow]:
+        """
+        Get status of a registered service as a live ServiceRow, or None.
+        The row is a read/write view, not a dict; call to_dict() for a
+        serializable snapshot.
+        """
         return self.registered_services.get(name)
 
+    def set_service_status(self, name: str, status: str):
+        """Update the status of a registered service (e.g. 'inactive')."""
+        self.registered_services.set_status(name, status)
+
     def get_integration_report(self) -> Dict[str, Any]:
         """Generate integration health report."""
-        uptime = time.time() - self._start_time
+        uptime = time.monotonic() - self._start_time
         return {
             'version': self.VERSION,
             'uptime_seconds': round(uptime, 2),
             'services_registered': len(self.registered_services),
-            'messages_processed': len(self.processed_messages),
-            'pending_messages': len([m for m in self.message_queue if m['status'] == 'pending']),
-            'services': {
-                name: {'type': s['type'], 'status': s['status'], 'messages': s['message_count']}
-                for name, s in self.registered_services.items()
-            },
+            'messages_processed': self._total_processed,
+            'pending_messages': self._pending_count + self._inbox.qsize(),
+            'services': self._service_summary(),
+        }
+
+    def _service_summary(self) -> Dict[str, Dict[str, Any]]:
+        """Per-service type/status/message summary, read straight from the columns."""
+        services = self.registered_services
+        status_names = services.status_names
+        return {
+            name: {'type': t, 'status': status_names[code], 'messages': count}
+            for name, t, code, count in zip(
+                services.names, services.types, services.status, services.message_counts
+            )
         }
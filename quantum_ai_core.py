@@ -4,14 +4,133 @@ Core quantum-classical hybrid processing engine for the System Integration Progr
 Provides unified interface for quantum circuit execution, ML inference, and system orchestration.
 """
 
+import copy
 import time
 import logging
 import hashlib
-from typing import Dict, Any, List, Optional
+from collections import deque
+from typing import Deque, Dict, Any, List, Optional
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional; the NumPy kernel is used instead
+    njit = None
+    prange = range
+
+try:
+    # Ahead-of-time build of the annealing kernel (see build_quantum_kernels.py)
+    import quantum_kernels
+except ImportError:
+    quantum_kernels = None
 
 logger = logging.getLogger(__name__)
 
 
+def _anneal_numpy(iterations: int, cooling_rate: float, minimize: bool, rng=None):
+    """Vectorized annealing: draw every candidate against the geometric schedule at once."""
+    if iterations <= 0:
+        return (float('inf') if minimize else float('-inf')), 1.0
+    temps = cooling_rate ** np.arange(iterations)
+    normal = np.random.standard_normal if rng is None else rng.standard_normal
+    samples = normal(iterations) * temps
+    best = samples.min() if minimize else samples.max()
+    return float(best), float(temps[-1] * cooling_rate)
+
+
+def _anneal_loop(iterations: int, cooling_rate: float, minimize: bool, rng=None):
+    """
+    Scalar annealing kernel, compiled to native code when numba is available.
+    Draws from rng (a numpy Generator) if given, else from the module-level
+    stream, which numba keeps per thread inside parallel loops.
+    """
+    # The objective is loop-invariant, so it is tested once; min/max inside
+    # the loop lower to branchless minsd/maxsd instead of a data-dependent jump.
+    # `rng is None` is resolved at compile time for each specialization.
+    t = 1.0
+    if minimize:
+        best = np.inf
+        for i in range(iterations):
+            c = np.random.normal(0.0, t) if rng is None else rng.normal(0.0, t)
+            best = min(best, c)
+            t *= cooling_rate
+    else:
+        best = -np.inf
+        for i in range(iterations):
+            c = np.random.normal(0.0, t) if rng is None else rng.normal(0.0, t)
+            best = max(best, c)
+            t *= cooling_rate
+    return best, t
+
+
+if njit is not None:
+    _anneal_kernel = njit(cache=True)(_anneal_loop)
+else:
+    _anneal_kernel = _anneal_numpy
+
+
+def _anneal_batch_loop(seeds, iterations, cooling_rates, minimize, best_out, temp_out):
+    """
+    Run independent annealing jobs across cores. A Generator cannot be
+    shared between threads, so each job reseeds its thread's module-level
+    stream from seeds[k]; results do not depend on thread scheduling.
+    """
+    for k in prange(iterations.size):
+        np.random.seed(seeds[k])
+        best_out[k], temp_out[k] = _anneal_kernel(iterations[k], cooling_rates[k], minimize[k])
+
+
+def _anneal_batch_serial(seeds, iterations, cooling_rates, minimize, best_out, temp_out):
+    """Serial fallback: one seeded Generator per job, leaving NumPy's global stream alone."""
+    for k in range(iterations.size):
+        rng = np.random.default_rng(seeds[k])
+        best_out[k], temp_out[k] = _anneal_numpy(iterations[k], cooling_rates[k], minimize[k], rng)
+
+
+if njit is not None:
+    _anneal_batch = njit(parallel=True, cache=True)(_anneal_batch_loop)
+else:
+    _anneal_batch = _anneal_batch_serial
+
+
+def _anneal_aot(iterations: int, cooling_rate: float, minimize: bool, rng=None):
+    """Run the AOT-compiled kernel, reseeding its internal stream from rng."""
+    if rng is not None:
+        quantum_kernels.seed(int(rng.integers(2 ** 32)))
+    return quantum_kernels.anneal(iterations, cooling_rate, minimize, None)
+
+
+if quantum_kernels is not None:
+    # Precompiled: no JIT work at import or on the first task
+    _anneal = _anneal_aot
+elif njit is not None:
+    _anneal = _anneal_kernel
+    # Compile (or load from cache) at import, not on first task
+    _anneal(1, 0.99, True, np.random.default_rng())
+else:
+    _anneal = _anneal_numpy
+
+
+_SCALAR_TYPES = (str, int, float, bool, bytes, type(None))
+
+
+def _canonical(value: Any):
+    """
+    Type-tagged, key-order-independent form of a task input whose repr is
+    unique per distinct value (1 vs '1', tuple vs list stay apart).
+    Raises TypeError for values outside plain containers and scalars.
+    """
+    if type(value) is dict:
+        items = [(_canonical(k), _canonical(v)) for k, v in value.items()]
+        return ('dict', tuple(sorted(items, key=repr)))
+    if type(value) in (list, tuple):
+        return (type(value).__name__, tuple(_canonical(v) for v in value))
+    if type(value) in _SCALAR_TYPES:
+        return (type(value).__name__, value)
+    raise TypeError(f"Uncacheable task input of type {type(value).__name__}")
+
+
 class QuantumAICore:
     """
     Quantum AI Core Engine v2.0
@@ -28,13 +147,26 @@ class QuantumAICore:
 
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         self.config = config or {}
-        self.processing_log: List[Dict[str, Any]] = []
+        self.processing_log: Deque[Dict[str, Any]] = deque(maxlen=self.config.get('log_capacity', 10_000))
         self.models_loaded: Dict[str, Any] = {}
         self.quantum_backend = self.config.get('quantum_backend', 'simulator')
         self.optimization_level = self.config.get('optimization_level', 2)
-        self._start_time = time.time()
+        self._start_time = time.monotonic()
         self.total_operations = 0
-        logger.info(f"QuantumAICore v{self.VERSION} initialized (backend={self.quantum_backend})")
+        self._rng = np.random.default_rng(self.config.get('seed'))
+        self._dispatch = {
+            'quantum_optimize': self._quantum_optimize,
+            'ml_inference': self._ml_inference,
+            'hybrid_compute': self._hybrid_compute,
+            'health_check': lambda data, params: self.health_check(),
+        }
+        # Memoization is opt-in: list deterministic task types under 'cache_tasks'
+        self._result_cache: Dict[bytes, Dict[str, Any]] = {}
+        self._cache_capacity = self.config.get('cache_capacity', 1024)
+        self._cacheable_tasks = (
+            frozenset(self.config.get('cache_tasks', ())) if self._cache_capacity > 0 else frozenset()
+        )
+        logger.info("QuantumAICore v%s initialized (backend=%s)", self.VERSION, self.quantum_backend)
 
     def process(self, task: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -46,7 +178,7 @@ class QuantumAICore:
         Returns:
             Processing result dict
         """
-        start = time.time()
+        start = time.perf_counter()
         task_type = task.get('type', 'unknown')
         data = task.get('data', {})
         params = task.get('parameters', {})
@@ -57,23 +189,99 @@ class QuantumAICore:
             'timestamp': time.time(),
         }
 
-        if task_type == 'quantum_optimize':
-            result['output'] = self._quantum_optimize(data, params)
-        elif task_type == 'ml_inference':
-            result['output'] = self._ml_inference(data, params)
-        elif task_type == 'hybrid_compute':
-            result['output'] = self._hybrid_compute(data, params)
-        elif task_type == 'health_check':
-            result['output'] = self.health_check()
-        else:
+        handler = self._dispatch.get(task_type)
+        if handler is None:
             result['status'] = 'error'
             result['error'] = f'Unknown task type: {task_type}'
+        elif task_type in self._cacheable_tasks:
+            result['output'] = self._cached_call(task_type, handler, data, params)
+        else:
+            result['output'] = handler(data, params)
 
-        result['duration'] = time.time() - start
+        result['duration'] = time.perf_counter() - start
         self.processing_log.append(result)
         self.total_operations += 1
         return result
 
+    def _cached_call(self, task_type: str, handler, data: Dict, params: Dict) -> Dict[str, Any]:
+        """Run a deterministic handler, memoized on a BLAKE2b digest of its inputs."""
+        try:
+            canonical = repr((task_type, _canonical(data), _canonical(params)))
+        except TypeError:
+            # Inputs without an exact canonical form are never cached
+            return handler(data, params)
+        key = hashlib.blake2b(canonical.encode(), digest_size=16).digest()
+
+        output = self._result_cache.get(key)
+        if output is None:
+            output = handler(data, params)
+            if len(self._result_cache) >= self._cache_capacity:
+                # Evict the oldest entry (dicts preserve insertion order)
+                del self._result_cache[next(iter(self._result_cache))]
+            self._result_cache[key] = output
+        # Outputs nest dicts; a deep copy keeps callers from mutating the cached entry
+        return copy.deepcopy(output)
+
+    def process_batch(self, tasks: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Process many independent tasks.
+
+        quantum_optimize tasks are packed into contiguous arrays and run
+        through one parallel annealing kernel; every other task, including
+        quantum_optimize when it is listed under 'cache_tasks', goes through
+        process(). Results are returned in input order, and batched tasks
+        report their share of the kernel time as 'duration'.
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(tasks)
+        batched = []
+        batchable = 'quantum_optimize' not in self._cacheable_tasks
+        for i, task in enumerate(tasks):
+            if (batchable and task.get('type') == 'quantum_optimize'
+                    and task.get('data', {}).get('objective', 'minimize') in ('minimize', 'maximize')):
+                batched.append(i)
+            else:
+                results[i] = self.process(task)
+
+        if not batched:
+            return results
+
+        start = time.perf_counter()
+        timestamp = time.time()
+        n = len(batched)
+        iterations = np.empty(n, dtype=np.int64)
+        cooling_rates = np.empty(n, dtype=np.float64)
+        minimize = np.empty(n, dtype=np.bool_)
+        for k, i in enumerate(batched):
+            params = tasks[i].get('parameters', {})
+            iterations[k] = params.get('iterations', 100)
+            cooling_rates[k] = params.get('cooling_rate', 0.99)
+            minimize[k] = tasks[i].get('data', {}).get('objective', 'minimize') == 'minimize'
+
+        best_scores = np.empty(n, dtype=np.float64)
+        temperatures = np.empty(n, dtype=np.float64)
+        # Per-job seeds come from the instance Generator, so a seeded core
+        # reproduces its batches just like its single process() calls
+        seeds = self._rng.integers(0, 2 ** 32, size=n, dtype=np.int64)
+        _anneal_batch(seeds, iterations, cooling_rates, minimize, best_scores, temperatures)
+        duration = (time.perf_counter() - start) / n
+
+        for k, i in enumerate(batched):
+            result = {
+                'task_type': 'quantum_optimize',
+                'status': 'completed',
+                'timestamp': timestamp,
+                'output': self._optimize_output(
+                    float(best_scores[k]),
+                    tasks[i].get('parameters', {}).get('iterations', 100),
+                    float(temperatures[k]),
+                ),
+                'duration': duration,
+            }
+            self.processing_log.append(result)
+            results[i] = result
+        self.total_operations += n
+        return results
+
     def _quantum_optimize(self, data: Dict, params: Dict) -> Dict[str, Any]:
         """Run quantum-inspired optimization on input data."""
         objective = data.get('objective', 'minimize')
@@ -81,19 +289,18 @@ class QuantumAICore:
         iterations = params.get('iterations', 100)
 
         # Simulated quantum annealing
-        import random
+        cooling_rate = params.get('cooling_rate', 0.99)
         best_score = float('inf') if objective == 'minimize' else float('-inf')
-        temperature = 1.0
-        cooling_rate = 0.99
+        temperature = cooling_rate ** max(iterations, 0)
 
-        for i in range(iterations):
-            candidate_score = random.gauss(0, temperature)
-            if objective == 'minimize' and candidate_score < best_score:
-                best_score = candidate_score
-            elif objective == 'maximize' and candidate_score > best_score:
-                best_score = candidate_score
-            temperature *= cooling_rate
+        if objective in ('minimize', 'maximize'):
+            best_score, temperature = _anneal(int(iterations), cooling_rate, objective == 'minimize', self._rng)
+
+        return self._optimize_output(best_score, iterations, temperature)
 
+    @staticmethod
+    def _optimize_output(best_score: float, iterations: int, temperature: float) -> Dict[str, Any]:
+        """Shape an annealing result as a quantum_optimize output."""
         return {
             'best_score': best_score,
             'iterations': iterations,
@@ -122,7 +329,7 @@ class QuantumAICore:
 
     def health_check(self) -> Dict[str, Any]:
         """System health check."""
-        uptime = time.time() - self._start_time
+        uptime = time.monotonic() - self._start_time
         return {
             'version': self.VERSION,
             'status': 'healthy',
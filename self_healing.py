@@ -6,7 +6,12 @@ Monitors integration health and auto-recovers from failures.
 
 import time
 import logging
-from typing import Dict, Any, List
+from collections import deque
+from typing import Deque, Dict, Any, List, Mapping
+
+import numpy as np
+
+from integration_engine import STATUS_ACTIVE, ServiceTable
 
 logger = logging.getLogger(__name__)
 
@@ -23,31 +28,44 @@ class SelfHealing:
     """
 
     VERSION = "2.0.6"
+    LOG_CAPACITY = 10_000
 
     def __init__(self, check_interval: float = 5.0):
         self.check_interval = check_interval
         self.health_status = 'healthy'
-        self.fault_log: List[Dict[str, Any]] = []
-        self.repairs: List[Dict[str, Any]] = []
-        self._start_time = time.time()
+        self.fault_log: Deque[Dict[str, Any]] = deque(maxlen=self.LOG_CAPACITY)
+        self.repairs: Deque[Dict[str, Any]] = deque(maxlen=self.LOG_CAPACITY)
+        self._total_faults = 0
+        self._total_repairs = 0
+        self._start_time = time.monotonic()
 
-    def check_health(self, services: Dict[str, Dict]) -> Dict[str, Any]:
+    def check_health(self, services: Mapping[str, Dict]) -> Dict[str, Any]:
         """
         Check health of all integrated services.
         Returns health report with any detected issues.
         """
-        issues = []
-        for name, service in services.items():
-            if service.get('status') != 'active':
-                issues.append({
-                    'service': name,
-                    'issue': 'inactive',
-                    'severity': 'warning',
-                })
+        if isinstance(services, ServiceTable):
+            # Columnar registry: one vectorized compare over the status codes
+            bad = np.flatnonzero(services.status != STATUS_ACTIVE)
+            names = services.names
+            issues = [
+                {'service': names[i], 'issue': 'inactive', 'severity': 'warning'}
+                for i in bad
+            ]
+        else:
+            issues = []
+            for name, service in services.items():
+                if service.get('status') != 'active':
+                    issues.append({
+                        'service': name,
+                        'issue': 'inactive',
+                        'severity': 'warning',
+                    })
 
         if issues:
             self.health_status = 'degraded'
             self.fault_log.extend(issues)
+            self._total_faults += len(issues)
         else:
             self.health_status = 'healthy'
 
@@ -58,33 +76,51 @@ class SelfHealing:
             'timestamp': time.time(),
         }
 
-    def auto_repair(self, services: Dict[str, Dict]) -> List[Dict[str, Any]]:
+    def auto_repair(self, services: Mapping[str, Dict]) -> List[Dict[str, Any]]:
         """Attempt automatic repair of detected issues."""
         repairs = []
-        for name, service in services.items():
-            if service.get('status') != 'active':
-                # Attempt reactivation
-                service['status'] = 'active'
-                repair = {
-                    'service': name,
-                    'action': 'reactivated',
-                    'timestamp': time.time(),
-                }
-                repairs.append(repair)
-                logger.info(f"Auto-repaired service: {name}")
+        if isinstance(services, ServiceTable):
+            # Columnar registry: repair with one mask write on the status column
+            mask = services.status != STATUS_ACTIVE
+            if mask.any():
+                now = time.time()
+                names = services.names
+                repairs = [
+                    {'service': names[i], 'action': 'reactivated', 'timestamp': now}
+                    for i in np.flatnonzero(mask)
+                ]
+                services.status[mask] = STATUS_ACTIVE
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info("Auto-repaired services: %s", ', '.join(r['service'] for r in repairs))
+            all_active = True
+        else:
+            now = time.time()
+            for name, service in services.items():
+                if service.get('status') != 'active':
+                    # Attempt reactivation
+                    service['status'] = 'active'
+                    repair = {
+                        'service': name,
+                        'action': 'reactivated',
+                        'timestamp': now,
+                    }
+                    repairs.append(repair)
+                    logger.info("Auto-repaired service: %s", name)
+            all_active = not [s for s in services.values() if s.get('status') != 'active']
 
         self.repairs.extend(repairs)
-        if not [s for s in services.values() if s.get('status') != 'active']:
+        self._total_repairs += len(repairs)
+        if all_active:
             self.health_status = 'healthy'
         return repairs
 
     def get_report(self) -> Dict[str, Any]:
         """Return self-healing report."""
-        uptime = time.time() - self._start_time
+        uptime = time.monotonic() - self._start_time
         return {
             'version': self.VERSION,
             'status': self.health_status,
             'uptime_seconds': round(uptime, 2),
-            'faults_detected': len(self.fault_log),
-            'repairs_executed': len(self.repairs),
+            'faults_detected': self._total_faults,
+            'repairs_executed': self._total_repairs,
         }
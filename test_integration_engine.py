@@ -0,0 +1,268 @@
+"""
+Behavior tests for IntegrationEngine, its ServiceTable registry, and its async and multi-producer paths.
+"""
+
+import asyncio
+import json
+import threading
+
+import numpy as np
+import pytest
+
+from integration_engine import IntegrationEngine, ServiceRow, ServiceTable
+from self_healing import SelfHealing
+
+
+def make_engine(*names):
+    engine = IntegrationEngine()
+    for name in names:
+        engine.register_service(name, 'worker')
+    return engine
+
+
+def test_async_futures_resolve_to_settled_message():
+    engine = make_engine('a', 'b')
+
+    async def run():
+        delivered = await engine.send_message_async('a', 'b', {'n': 1})
+        failed = await engine.send_message_async('a', 'missing', {'n': 2})
+        await engine.flush()
+        result = (delivered.result(), failed.result())
+        await engine.aclose()
+        return result
+
+    delivered, failed = asyncio.run(run())
+    assert delivered['status'] == 'delivered'
+    assert delivered['target'] == 'b'
+    assert delivered['payload'] == {'n': 1}
+    assert failed['status'] == 'error'
+    assert 'missing' in failed['error']
+    assert list(engine.message_queue) == [delivered, failed]
+
+
+def test_async_pending_count_rises_and_returns_to_zero():
+    engine = make_engine('a', 'b')
+
+    async def run():
+        for i in range(10):
+            await engine.send_message_async('a', 'b', {'n': i})
+        queued = engine.get_integration_report()['pending_messages']
+        await engine.flush()
+        settled = engine.get_integration_report()['pending_messages']
+        await engine.aclose()
+        return queued, settled
+
+    queued, settled = asyncio.run(run())
+    assert queued == 10
+    assert settled == 0
+    report = engine.get_integration_report()
+    assert report['messages_processed'] == 10
+    assert report['services']['b']['messages'] == 10
+
+
+def test_aclose_drains_queue_before_stopping_flusher():
+    engine = make_engine('a', 'b')
+    count = IntegrationEngine.ASYNC_BATCH_MAX * 2 + 3
+
+    async def run():
+        futures = [await engine.send_message_async('a', 'b', {'n': i}) for i in range(count)]
+        await engine.aclose()
+        return futures
+
+    futures = asyncio.run(run())
+    assert all(f.done() and f.result()['status'] == 'delivered' for f in futures)
+    assert engine._flusher is None
+    report = engine.get_integration_report()
+    assert report['pending_messages'] == 0
+    assert report['messages_processed'] == count
+    assert report['services']['b']['messages'] == count
+
+
+def test_async_bad_message_fails_only_its_future():
+    engine = make_engine('a', 'b')
+
+    async def run():
+        before = await engine.send_message_async('a', 'b', {'n': 1})
+        bad = await engine.send_message_async('a', ['x'], {'n': 2})
+        after = await engine.send_message_async('a', 'b', {'n': 3})
+        await asyncio.wait_for(engine.flush(), timeout=5)
+        pending = engine.get_integration_report()['pending_messages']
+        flusher_alive = not engine._flusher.done()
+        later = await engine.send_message_async('a', 'b', {'n': 4})
+        await asyncio.wait_for(engine.aclose(), timeout=5)
+        return before, bad, after, later, pending, flusher_alive
+
+    before, bad, after, later, pending, flusher_alive = asyncio.run(run())
+    assert isinstance(bad.exception(), TypeError)
+    assert [f.result()['payload']['n'] for f in (before, after, later)] == [1, 3, 4]
+    assert pending == 0
+    assert flusher_alive
+    report = engine.get_integration_report()
+    assert report['messages_processed'] == 3
+    assert report['services']['b']['messages'] == 3
+
+
+def test_async_flusher_restarts_after_it_stops():
+    engine = make_engine('a', 'b')
+
+    async def run():
+        await engine.send_message_async('a', 'b', {'n': 1})
+        await engine.flush()
+        engine._flusher.cancel()
+        await asyncio.sleep(0)
+        future = await engine.send_message_async('a', 'b', {'n': 2})
+        await asyncio.wait_for(engine.aclose(), timeout=5)
+        return future
+
+    future = asyncio.run(run())
+    assert future.result()['status'] == 'delivered'
+    assert engine.get_integration_report()['messages_processed'] == 2
+
+
+def test_concurrent_nowait_producers_drain_with_exact_counts():
+    engine = make_engine('a', 'b', 'c')
+    targets = ('a', 'b', 'c')
+    producers = 4
+    per_producer = 10_000
+
+    def produce(offset):
+        for i in range(per_producer):
+            engine.send_message_nowait('src', targets[(offset + i) % 3], {'i': i})
+
+    threads = [threading.Thread(target=produce, args=(k,)) for k in range(producers)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    expected = {name: 0 for name in targets}
+    for k in range(producers):
+        for i in range(per_producer):
+            expected[targets[(k + i) % 3]] += 1
+
+    assert engine.get_integration_report()['pending_messages'] == producers * per_producer
+    drained = engine.drain_messages()
+    assert len(drained) == producers * per_producer
+    assert all(m['status'] == 'delivered' for m in drained)
+    report = engine.get_integration_report()
+    assert report['pending_messages'] == 0
+    assert report['messages_processed'] == producers * per_producer
+    assert {name: report['services'][name]['messages'] for name in targets} == expected
+
+
+def test_drain_settles_unroutable_message_as_error():
+    engine = make_engine('a', 'b')
+    engine.send_message_nowait('a', 'b', {'n': 1})
+    engine.send_message_nowait('a', ['x'], {'n': 2})
+    engine.send_message_nowait('a', 'b', {'n': 3})
+
+    drained = engine.drain_messages()
+    assert [m['status'] for m in drained] == ['delivered', 'error', 'delivered']
+    assert 'error' in drained[1]
+    assert list(engine.message_queue) == drained
+    report = engine.get_integration_report()
+    assert report['pending_messages'] == 0
+    assert report['messages_processed'] == 3
+    assert report['services']['b']['messages'] == 2
+
+
+def test_service_status_is_live_row_with_plain_dict_snapshot():
+    engine = make_engine('a')
+    row = engine.get_service_status('a')
+    assert isinstance(row, ServiceRow)
+    snapshot = row.to_dict()
+    assert type(snapshot) is dict
+    assert json.loads(json.dumps(snapshot))['status'] == 'active'
+    assert engine.get_service_status('missing') is None
+
+
+def test_stale_service_row_fails_loudly():
+    engine = make_engine('a', 'b')
+    row = engine.registered_services['a']
+    del engine.registered_services['a']
+    with pytest.raises(LookupError, match="no longer registered"):
+        row.get('status')
+    with pytest.raises(LookupError):
+        row['status'] = 'inactive'
+    assert engine.registered_services['b']['status'] == 'active'
+
+
+def test_reregister_resets_row_in_place():
+    engine = make_engine('a', 'b')
+    engine.send_message('a', 'b', {})
+    row = engine.registered_services['b']
+    row['status'] = 'inactive'
+    row['owner'] = 'ops'
+
+    engine.register_service('b', 'gateway', endpoint='http://b')
+    assert row.to_dict() == {
+        'type': 'gateway',
+        'endpoint': 'http://b',
+        'config': {},
+        'status': 'active',
+        'registered_at': row['registered_at'],
+        'message_count': 0,
+    }
+    assert list(engine.registered_services) == ['a', 'b']
+
+
+def test_delete_reindexes_remaining_rows():
+    table = ServiceTable()
+    for i, name in enumerate('abcde'):
+        table[name] = {'type': 'worker', 'status': 'active' if i % 2 else 'inactive', 'slot': i}
+    del table['b']
+
+    assert list(table) == ['a', 'c', 'd', 'e']
+    assert table.names_tuple == ('a', 'c', 'd', 'e')
+    assert [table[name]['slot'] for name in table] == [0, 2, 3, 4]
+    assert [table[name]['status'] for name in table] == ['inactive', 'inactive', 'active', 'inactive']
+    assert 'b' not in table
+    with pytest.raises(KeyError):
+        table['b']
+
+
+def test_status_column_grows_past_initial_capacity():
+    table = ServiceTable()
+    names = [f'svc{i}' for i in range(37)]
+    for name in names:
+        table.add(name, 'worker', '', {}, 0.0)
+    table.set_status('svc3', 'inactive')
+    table['svc36']['status'] = 'degraded'
+
+    assert len(table.status) == len(names)
+    assert [table[name]['status'] for name in names].count('active') == len(names) - 2
+    assert table['svc3']['status'] == 'inactive'
+    assert table['svc36']['status'] == 'degraded'
+
+
+def test_row_extras_and_core_fields():
+    table = ServiceTable()
+    table['a'] = {'type': 'worker', 'region': 'eu'}
+    row = table['a']
+    row['region'] = 'us'
+    row['message_count'] = 5
+    assert table.message_counts == [5]
+    assert dict(row)['region'] == 'us'
+    del row['region']
+    assert 'region' not in row
+    with pytest.raises(TypeError):
+        del row['status']
+
+
+def test_status_code_limit_raises():
+    table = ServiceTable()
+    table._status = table._status.astype(np.uint8)
+    for i in range(1, 256):
+        table.status_code(f's{i}')
+    with pytest.raises(ValueError):
+        table.status_code('one-too-many')
+
+
+def test_row_status_write_is_seen_by_health_check():
+    engine = make_engine('a', 'b', 'c')
+    engine.registered_services['b']['status'] = 'inactive'
+
+    healer = SelfHealing()
+    report = healer.check_health(engine.registered_services)
+    assert report['status'] == 'degraded'
+    assert [issue['service'] for issue in report['issues']] == ['b']
@@ -0,0 +1,114 @@
+"""
+Behavior tests for QuantumAICore result caching and batch processing.
+"""
+
+import pytest
+
+import quantum_ai_core
+from quantum_ai_core import QuantumAICore
+
+
+def optimize_task(objective='minimize', iterations=50, **params):
+    return {
+        'type': 'quantum_optimize',
+        'data': {'objective': objective},
+        'parameters': dict(params, iterations=iterations),
+    }
+
+
+def test_cached_output_is_isolated_from_callers():
+    core = QuantumAICore({'seed': 1, 'cache_tasks': ['hybrid_compute']})
+    task = {'type': 'hybrid_compute', 'data': {'objective': 'minimize'}, 'parameters': {}}
+
+    first = core.process(task)
+    score = first['output']['quantum']['best_score']
+    first['output']['quantum']['best_score'] = 'poisoned'
+
+    second = core.process(task)
+    assert second['output']['quantum']['best_score'] == score
+    second['output']['quantum']['best_score'] = 'poisoned'
+    assert core.process(task)['output']['quantum']['best_score'] == score
+
+
+def test_cache_keeps_distinct_inputs_apart():
+    core = QuantumAICore({'seed': 1, 'cache_tasks': ['quantum_optimize']})
+    outputs = [
+        core.process(optimize_task(iterations=it))['output']['iterations']
+        for it in (1, 1.0, True)
+    ]
+    assert [type(v) for v in outputs] == [int, float, bool]
+
+
+def test_batch_routes_cacheable_optimize_through_process():
+    core = QuantumAICore({'seed': 1, 'cache_tasks': ['quantum_optimize']})
+    single = core.process(optimize_task())
+    batched = core.process_batch([optimize_task(), optimize_task()])
+    assert [r['output'] for r in batched] == [single['output']] * 2
+
+
+@pytest.fixture(params=['installed', 'serial'])
+def batch_kernel(request, monkeypatch):
+    """Run each batch test against the installed kernel and the serial fallback."""
+    if request.param == 'serial':
+        monkeypatch.setattr(quantum_ai_core, '_anneal_batch', quantum_ai_core._anneal_batch_serial)
+    return request.param
+
+
+def test_batch_empty(batch_kernel):
+    core = QuantumAICore({'seed': 3})
+    assert core.process_batch([]) == []
+    assert core.total_operations == 0
+
+
+def test_batch_keeps_input_order_with_mixed_tasks(batch_kernel):
+    core = QuantumAICore({'seed': 3})
+    tasks = [
+        optimize_task(iterations=10),
+        {'type': 'ml_inference', 'data': {}, 'parameters': {'model': 'm1'}},
+        optimize_task('maximize', iterations=20),
+        {'type': 'bogus'},
+        optimize_task('classify', iterations=30),
+        {'type': 'health_check'},
+    ]
+    results = core.process_batch(tasks)
+
+    assert [r['task_type'] for r in results] == [
+        'quantum_optimize', 'ml_inference', 'quantum_optimize', 'bogus', 'quantum_optimize', 'health_check',
+    ]
+    assert [r['status'] for r in results] == ['completed'] * 3 + ['error'] + ['completed'] * 2
+    assert [results[i]['output']['iterations'] for i in (0, 2, 4)] == [10, 20, 30]
+    assert results[1]['output']['model'] == 'm1'
+    # Unknown objectives skip annealing, as in process()
+    assert results[4]['output']['best_score'] == float('-inf')
+    assert core.total_operations == len(tasks)
+    assert len(core.processing_log) == len(tasks)
+
+
+def test_batch_is_reproducible_with_seeded_core(batch_kernel):
+    tasks = [optimize_task(iterations=200), optimize_task('maximize', iterations=200)] * 8
+    first = QuantumAICore({'seed': 42}).process_batch(tasks)
+    second = QuantumAICore({'seed': 42}).process_batch(tasks)
+    other = QuantumAICore({'seed': 43}).process_batch(tasks)
+
+    scores = [r['output']['best_score'] for r in first]
+    assert scores == [r['output']['best_score'] for r in second]
+    assert scores != [r['output']['best_score'] for r in other]
+    # Jobs draw independent seeds, so identical tasks do not repeat results
+    assert len(set(scores)) == len(scores)
+
+
+def test_batch_objectives_and_empty_schedules(batch_kernel):
+    core = QuantumAICore({'seed': 7})
+    results = core.process_batch([
+        optimize_task('minimize', iterations=500),
+        optimize_task('maximize', iterations=500),
+        optimize_task('minimize', iterations=0),
+        optimize_task('maximize', iterations=-5),
+    ])
+    outputs = [r['output'] for r in results]
+
+    assert outputs[0]['best_score'] < 0 < outputs[1]['best_score']
+    assert outputs[0]['final_temperature'] == pytest.approx(0.99 ** 500)
+    assert (outputs[2]['best_score'], outputs[2]['final_temperature']) == (float('inf'), 1.0)
+    assert (outputs[3]['best_score'], outputs[3]['final_temperature']) == (float('-inf'), 1.0)
+    assert outputs[3]['iterations'] == -5
@@ -0,0 +1,55 @@
+"""
+Behavior tests for SelfHealing: the columnar ServiceTable path must match
+the per-service dict path.
+"""
+
+from integration_engine import ServiceTable
+from self_healing import SelfHealing
+
+STATUSES = {'a': 'active', 'b': 'inactive', 'c': 'active', 'd': 'degraded', 'e': 'inactive'}
+
+
+def build_registries():
+    table = ServiceTable()
+    services = {}
+    for name, status in STATUSES.items():
+        table[name] = {'type': 'worker', 'status': status}
+        services[name] = {'type': 'worker', 'status': status}
+    return table, services
+
+
+def without_timestamps(records):
+    return [{k: v for k, v in r.items() if k != 'timestamp'} for r in records]
+
+
+def test_check_health_matches_dict_path():
+    table, services = build_registries()
+    columnar, plain = SelfHealing(), SelfHealing()
+
+    table_report = columnar.check_health(table)
+    dict_report = plain.check_health(services)
+    assert table_report['issues'] == dict_report['issues']
+    assert [i['service'] for i in table_report['issues']] == ['b', 'd', 'e']
+    assert table_report['status'] == dict_report['status'] == 'degraded'
+    assert table_report['services_checked'] == dict_report['services_checked'] == 5
+    assert list(columnar.fault_log) == list(plain.fault_log)
+    assert columnar.get_report()['faults_detected'] == plain.get_report()['faults_detected'] == 3
+
+
+def test_auto_repair_matches_dict_path():
+    table, services = build_registries()
+    columnar, plain = SelfHealing(), SelfHealing()
+    columnar.check_health(table)
+    plain.check_health(services)
+
+    table_repairs = columnar.auto_repair(table)
+    dict_repairs = plain.auto_repair(services)
+    assert without_timestamps(table_repairs) == without_timestamps(dict_repairs)
+    assert [r['service'] for r in table_repairs] == ['b', 'd', 'e']
+    assert columnar.health_status == plain.health_status == 'healthy'
+    assert [table[name]['status'] for name in table] == [s['status'] for s in services.values()]
+    assert all(s['status'] == 'active' for s in services.values())
+    assert columnar.get_report()['repairs_executed'] == plain.get_report()['repairs_executed'] == 3
+
+    assert columnar.auto_repair(table) == plain.auto_repair(services) == []
+    assert columnar.check_health(table)['issues'] == plain.check_health(services)['issues'] == []